@@ -0,0 +1,541 @@
+"""
+Local load-test harness for the example app.
+
+Drives `GET /users/` with a configurable request mix and concurrency and reports
+throughput and p50/p95/p99 latency. Everything runs on one machine, without any
+external network:
+
+- `inprocess` mode calls the ASGI app directly (no sockets at all), which isolates
+  middleware, dependency and serialization costs from the HTTP server;
+- `uvicorn` mode starts local uvicorn worker(s) on the loopback interface and talks
+  plain HTTP/1.1 keep-alive to them, which adds the server and event-loop effects.
+
+Usage:
+    python loadtest.py --mode inprocess --concurrency 32 --requests 5000
+    python loadtest.py --mode inprocess --no-middleware
+    python loadtest.py --mode uvicorn --workers 4 --concurrency 64 --json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import os
+import random
+import socket
+import statistics
+import sys
+import time
+import typing as tp
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from urllib.parse import urlencode
+
+import fastapi
+from app import HOST, create_app
+from pydantic.alias_generators import to_camel
+from starlette.types import Message
+
+EXAMPLE_DIR = os.path.dirname(os.path.abspath(__file__))
+ENDPOINT_PATH = "/users/"
+MIDDLEWARE_ENV_VAR = "LOADTEST_MIDDLEWARE"
+
+DEFAULT_PAGES = [1, 2, 5]
+DEFAULT_PAGE_SIZES = [10, 20]
+DEFAULT_SORTS = ["-id", "name,-age", "isActive,-id", "age,name"]
+
+
+def create_loadtest_app() -> fastapi.FastAPI:
+    """
+    App factory used by the harness, e.g. `uvicorn loadtest:create_loadtest_app --factory`.
+
+    Same as `app.create_app()`, but user middlewares can be switched off with the
+    `LOADTEST_MIDDLEWARE=0` environment variable (needed to pass the option to
+    uvicorn worker processes).
+    """
+    fastapi_app = create_app()
+
+    if os.environ.get(MIDDLEWARE_ENV_VAR, "1") == "0":
+        # the middleware stack is built lazily on the first request
+        fastapi_app.user_middleware.clear()
+
+    return fastapi_app
+
+
+@dataclass(frozen=True)
+class PlannedRequest:
+    query_string: str
+    page: int
+    page_size: int
+    is_active: bool | None = None
+
+    def is_expected(self, body: bytes) -> bool:
+        """Checks that the app served the requested page, page size and filter (i.e. no param was ignored)."""
+        try:
+            payload = json.loads(body)
+            data, pagination = payload["data"], payload["pagination"]
+            total = pagination["total"]
+        except (ValueError, KeyError, TypeError):
+            return False
+
+        expected_page_size = max(0, min(self.page_size, total - (self.page - 1) * self.page_size))
+
+        if pagination["page"] != self.page or pagination["pageSize"] != expected_page_size:
+            return False
+
+        if len(data) != expected_page_size:
+            return False
+
+        return self.is_active is None or all(item["isActive"] == self.is_active for item in data)
+
+
+@dataclass
+class RequestMix:
+    pages: list[int] = field(default_factory=lambda: list(DEFAULT_PAGES))
+    page_sizes: list[int] = field(default_factory=lambda: list(DEFAULT_PAGE_SIZES))
+    sorts: list[str] = field(default_factory=lambda: list(DEFAULT_SORTS))
+    key_style: tp.Literal["snake", "camel", "mixed"] = "mixed"
+    with_filters: bool = True
+
+    def requests(self) -> list[PlannedRequest]:
+        """
+        All query combinations of the mix, the harness picks from them at random.
+
+        Query keys are snake_case as the app declares them, `camel` and `mixed` styles also send
+        camelCase keys, which only the `CamelCaseQueryParamsMiddleware` translates back.
+        """
+        key_styles_by_name: dict[str, list[tp.Callable[[str], str]]] = {
+            "snake": [str],
+            "camel": [to_camel],
+            "mixed": [str, to_camel],
+        }
+        key_styles = key_styles_by_name[self.key_style]
+
+        filters: list[bool | None] = [None]
+
+        if self.with_filters:
+            filters += [True, False]
+
+        return [
+            PlannedRequest(
+                query_string=urlencode(
+                    {
+                        key_style("page"): page,
+                        key_style("page_size"): page_size,
+                        key_style("sort"): sort,
+                        **({} if is_active is None else {key_style("is_active"): str(is_active).lower()}),
+                    },
+                ),
+                page=page,
+                page_size=page_size,
+                is_active=is_active,
+            )
+            for page, page_size, sort, is_active, key_style in itertools.product(
+                self.pages,
+                self.page_sizes,
+                self.sorts,
+                filters,
+                key_styles,
+            )
+        ]
+
+
+@dataclass
+class LoadTestResult:
+    mode: str
+    middleware: bool
+    concurrency: int
+    requests: int
+    errors: int
+    unexpected: int
+    duration: float
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+
+    def render(self) -> str:
+        return "\n".join(
+            [
+                f"mode:        {self.mode} (middleware {'on' if self.middleware else 'off'})",
+                f"concurrency: {self.concurrency}",
+                f"requests:    {self.requests} ({self.errors} errors, {self.unexpected} unexpected responses)",
+                f"duration:    {self.duration:.3f} s",
+                f"throughput:  {self.throughput:.1f} req/s",
+                f"latency:     p50={self.p50:.2f} ms  p95={self.p95:.2f} ms  p99={self.p99:.2f} ms",
+            ],
+        )
+
+
+type RequestSender = tp.Callable[[str], tp.Awaitable[tuple[int, bytes]]]
+
+
+class InProcessClient:
+    """Calls the ASGI application directly, no sockets involved."""
+
+    def __init__(self, app: fastapi.FastAPI) -> None:
+        self.app = app
+
+    async def __call__(self, query_string: str) -> tuple[int, bytes]:
+        status = 0
+        body: list[bytes] = []
+        response_complete = asyncio.Event()
+        request_sent = False
+
+        async def receive() -> Message:
+            nonlocal request_sent
+
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                body.append(message.get("body", b""))
+
+                if not message.get("more_body", False):
+                    response_complete.set()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": ENDPOINT_PATH,
+            "raw_path": ENDPOINT_PATH.encode(),
+            "root_path": "",
+            "query_string": query_string.encode(),
+            "headers": [(b"host", b"loadtest"), (b"accept", b"application/json")],
+            "server": ("loadtest", 80),
+            "client": ("127.0.0.1", 0),
+        }
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            # `ServerErrorMiddleware` re-raises after sending 500, count it as an error like a server would
+            if not status:
+                raise
+
+        return status, b"".join(body)
+
+
+class KeepAliveHttpClient:
+    """Minimal HTTP/1.1 keep-alive client, one connection per concurrent worker."""
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self._connection: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None = None
+
+    async def __call__(self, query_string: str) -> tuple[int, bytes]:
+        if self._connection is None:
+            self._connection = await asyncio.open_connection(self.host, self.port)
+
+        reader, writer = self._connection
+
+        writer.write(
+            (
+                f"GET {ENDPOINT_PATH}?{query_string} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                "Accept: application/json\r\n"
+                "\r\n"
+            ).encode(),
+        )
+        await writer.drain()
+
+        status_line = await reader.readline()
+        status = int(status_line.split()[1])
+        content_length = 0
+        keep_alive = True
+
+        while (header := await reader.readline()) not in (b"\r\n", b""):
+            name, _, value = header.decode("latin-1").partition(":")
+
+            match name.strip().lower():
+                case "content-length":
+                    content_length = int(value)
+                case "connection":
+                    keep_alive = value.strip().lower() != "close"
+
+        body = await reader.readexactly(content_length)
+
+        if not keep_alive:
+            await self.close()
+
+        return status, body
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            _, writer = self._connection
+            self._connection = None
+            writer.close()
+
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+
+@dataclass
+class LoadRun:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    unexpected: int = 0
+    duration: float = 0.0
+
+
+async def run_load(
+    senders: Sequence[RequestSender],
+    planned_requests: list[PlannedRequest],
+    *,
+    requests: int,
+    warmup: int,
+    seed: int,
+) -> LoadRun:
+    """
+    Runs `requests` requests spread over `len(senders)` concurrent workers.
+
+    Non-2xx responses are counted as errors, 2xx responses not matching the requested
+    page, page size or filter are counted as unexpected.
+    """
+    rnd = random.Random(seed)  # noqa: S311
+    plan = [rnd.choice(planned_requests) for _ in range(warmup + requests)]
+
+    for planned_request in plan[:warmup]:
+        await senders[0](planned_request.query_string)
+
+    queue = iter(plan[warmup:])
+    run = LoadRun()
+
+    async def worker(send: RequestSender) -> None:
+        for planned_request in queue:
+            started_at = time.perf_counter()
+            status, body = await send(planned_request.query_string)
+            run.latencies.append((time.perf_counter() - started_at) * 1000)
+
+            if not 200 <= status < 300:
+                run.errors += 1
+            elif not planned_request.is_expected(body):
+                run.unexpected += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker(send) for send in senders))
+    run.duration = time.perf_counter() - started_at
+
+    return run
+
+
+def summarize(
+    run: LoadRun,
+    *,
+    mode: str,
+    middleware: bool,
+    concurrency: int,
+) -> LoadTestResult:
+    latencies = run.latencies
+
+    if len(latencies) > 1:
+        percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = percentiles[49], percentiles[94], percentiles[98]
+    else:
+        p50 = p95 = p99 = latencies[0] if latencies else 0.0
+
+    return LoadTestResult(
+        mode=mode,
+        middleware=middleware,
+        concurrency=concurrency,
+        requests=len(latencies),
+        errors=run.errors,
+        unexpected=run.unexpected,
+        duration=run.duration,
+        throughput=len(latencies) / run.duration if run.duration else 0.0,
+        p50=p50,
+        p95=p95,
+        p99=p99,
+    )
+
+
+async def run_inprocess(args: argparse.Namespace, planned_requests: list[PlannedRequest]) -> LoadTestResult:
+    os.environ[MIDDLEWARE_ENV_VAR] = "1" if args.middleware else "0"
+    client = InProcessClient(create_loadtest_app())
+
+    run = await run_load(
+        [client] * args.concurrency,
+        planned_requests,
+        requests=args.requests,
+        warmup=args.warmup,
+        seed=args.seed,
+    )
+
+    return summarize(
+        run,
+        mode="inprocess",
+        middleware=args.middleware,
+        concurrency=args.concurrency,
+    )
+
+
+def _get_free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return int(sock.getsockname()[1])
+
+
+async def _wait_for_port(host: str, port: int) -> None:
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            await asyncio.sleep(0.05)
+        else:
+            writer.close()
+            return
+
+
+async def run_uvicorn(args: argparse.Namespace, planned_requests: list[PlannedRequest]) -> LoadTestResult:
+    port = args.port or _get_free_port(HOST)
+
+    server = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "loadtest:create_loadtest_app",
+        "--factory",
+        "--host",
+        HOST,
+        "--port",
+        str(port),
+        "--workers",
+        str(args.workers),
+        "--log-level",
+        "warning",
+        "--no-access-log",
+        cwd=EXAMPLE_DIR,
+        env={**os.environ, MIDDLEWARE_ENV_VAR: "1" if args.middleware else "0"},
+        stdout=asyncio.subprocess.DEVNULL,
+    )
+
+    clients = [KeepAliveHttpClient(HOST, port) for _ in range(args.concurrency)]
+
+    try:
+        try:
+            async with asyncio.timeout(args.startup_timeout):
+                await _wait_for_port(HOST, port)
+        except TimeoutError:
+            raise TimeoutError(
+                f"uvicorn did not start listening on {HOST}:{port} in {args.startup_timeout} s",
+            ) from None
+
+        run = await run_load(
+            clients,
+            planned_requests,
+            requests=args.requests,
+            warmup=args.warmup,
+            seed=args.seed,
+        )
+    finally:
+        await asyncio.gather(*(client.close() for client in clients))
+        server.terminate()
+        await server.wait()
+
+    return summarize(
+        run,
+        mode=f"uvicorn x{args.workers}",
+        middleware=args.middleware,
+        concurrency=args.concurrency,
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    def int_list(value: str) -> list[int]:
+        return [int(v) for v in value.split(",") if v]
+
+    parser = argparse.ArgumentParser(description="Load-test `GET /users/` of the example app.")
+    parser.add_argument("--mode", choices=["inprocess", "uvicorn"], default="inprocess")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent clients (default: 16)")
+    parser.add_argument("--requests", type=int, default=2000, help="measured requests (default: 2000)")
+    parser.add_argument("--warmup", type=int, default=100, help="requests sent before measuring (default: 100)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the request mix order (default: 0)")
+    parser.add_argument(
+        "--middleware",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="enable app middlewares (default: on)",
+    )
+
+    mix = parser.add_argument_group("request mix")
+    mix.add_argument("--pages", type=int_list, default=DEFAULT_PAGES, help="comma separated page numbers")
+    mix.add_argument("--page-sizes", type=int_list, default=DEFAULT_PAGE_SIZES, help="comma separated page sizes")
+    mix.add_argument(
+        "--sort",
+        dest="sorts",
+        action="append",
+        default=None,
+        help=f"sort query value, may be repeated (default: {' '.join(DEFAULT_SORTS)})",
+    )
+    mix.add_argument(
+        "--key-style",
+        choices=["snake", "camel", "mixed"],
+        default=None,
+        help=(
+            "style of the query keys, e.g. `page_size` vs `pageSize`, camelCase needs the middleware "
+            "(default: mixed with middleware, snake without)"
+        ),
+    )
+    mix.add_argument("--no-filters", dest="with_filters", action="store_false", help="do not send filter params")
+
+    server = parser.add_argument_group("uvicorn mode")
+    server.add_argument("--workers", type=int, default=1, help="uvicorn worker processes (default: 1)")
+    server.add_argument("--port", type=int, default=0, help="port to listen on (default: random free port)")
+    server.add_argument("--startup-timeout", type=float, default=10.0, help="seconds to wait for uvicorn")
+
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+
+    args = parser.parse_args(argv)
+
+    if args.key_style is None:
+        args.key_style = "mixed" if args.middleware else "snake"
+    elif args.key_style != "snake" and not args.middleware:
+        # the app would ignore camelCase params and serve other pages than in the middleware runs
+        parser.error("camelCase query keys are translated by the middleware only, use `--key-style snake`")
+
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    planned_requests = RequestMix(
+        pages=args.pages,
+        page_sizes=args.page_sizes,
+        sorts=args.sorts or DEFAULT_SORTS,
+        key_style=args.key_style,
+        with_filters=args.with_filters,
+    ).requests()
+
+    match args.mode:
+        case "inprocess":
+            # the example endpoint prints every request, keep it out of the report
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                result = asyncio.run(run_inprocess(args, planned_requests))
+        case "uvicorn":
+            result = asyncio.run(run_uvicorn(args, planned_requests))
+        case _:
+            raise ValueError(f"Unknown mode {args.mode!r}")
+
+    if args.json:
+        print(json.dumps(asdict(result)))  # noqa: T201
+    else:
+        print(result.render())  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,8 @@ from . import response
 
 
 sorting = Sorting()
-pagination = Pagination()
+# query params are snake_case for handlers, `CamelCaseQueryParamsMiddleware` translates `pageSize` etc.
+pagination = Pagination(url_page_size_query_param_name="page_size")
 
 
 @router.get("/")
@@ -34,15 +35,4 @@ def get_users(
         _sort_by=sort_by,
     )
 
-    return paginator(
-        [
-            response.User(
-                id=user.id,
-                age=user.age,
-                name=user.name,
-                is_active=user.is_active,
-            )
-            for user in users
-        ],
-        total=total,
-    )
+    return paginator(users, model=response.User, total=total)
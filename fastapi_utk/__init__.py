@@ -1,14 +1,33 @@
-from .not_set import NotSet
-from .pagination import Paginated, Pagination, Paginator
-from .sorting import Sorting, SortingOption
+import typing as tp
+
+from ._lazy import lazy_attributes
+
+if tp.TYPE_CHECKING:
+    from .not_set import NotSet
+    from .pagination import Paginated, PaginatedJSONResponse, Pagination, Paginator
+    from .sorting import Sorting, SortingOption
 
 __all__ = [
     "Pagination",
     "Paginator",
     "Paginated",
+    "PaginatedJSONResponse",
     "Sorting",
     "SortingOption",
     "NotSet",
 ]
 
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {
+        "NotSet": ".not_set",
+        "Paginated": ".pagination",
+        "PaginatedJSONResponse": ".pagination",
+        "Pagination": ".pagination",
+        "Paginator": ".pagination",
+        "Sorting": ".sorting",
+        "SortingOption": ".sorting",
+    },
+)
+
 __version__ = "1.0.3"
@@ -0,0 +1,40 @@
+import typing as tp
+from importlib import import_module
+
+__all__ = [
+    "lazy_attributes",
+]
+
+
+def lazy_attributes(
+    module_globals: dict[str, tp.Any],
+    attributes: dict[str, str],
+) -> tuple[tp.Callable[[str], tp.Any], tp.Callable[[], list[str]]]:
+    """
+    Builds PEP 562 module `__getattr__` and `__dir__` importing public names on first access.
+
+    Keeps `import fastapi_utk` cheap: FastAPI, Starlette and Pydantic are imported only
+    when something depending on them is used.
+
+    Attributes:
+        module_globals: `globals()` of the package, loaded names are cached there.
+        attributes: Public name to relative module mapping, e.g. `{"Paginator": ".paginator"}`.
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_attributes(globals(), {"NotSet": ".not_set"})
+    """
+    package = module_globals["__name__"]
+
+    def _getattr(name: str) -> tp.Any:  # noqa: ANN401
+        if (module_name := attributes.get(name)) is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(module_name, package), name)
+        module_globals[name] = value
+
+        return value
+
+    def _dir() -> list[str]:
+        return sorted({*module_globals, *attributes})
+
+    return _getattr, _dir
@@ -0,0 +1,20 @@
+import typing as tp
+
+from .._lazy import lazy_attributes
+
+if tp.TYPE_CHECKING:
+    from .backend import CacheBackend
+    from .shared_memory import SharedMemoryCache
+
+__all__ = [
+    "CacheBackend",
+    "SharedMemoryCache",
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {
+        "CacheBackend": ".backend",
+        "SharedMemoryCache": ".shared_memory",
+    },
+)
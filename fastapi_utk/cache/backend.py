@@ -0,0 +1,33 @@
+import typing as tp
+
+from ..not_set import NotSet
+
+__all__ = [
+    "CacheBackend",
+]
+
+
+@tp.runtime_checkable
+class CacheBackend(tp.Protocol):
+    """
+    Key-value cache interface used for caching pagination and sorting related data
+    (totals, pages, parsed options).
+
+    A miss is reported as `None`, so `None` itself can't be cached.
+    """
+
+    def get(self, key: str) -> tp.Any | None: ...  # noqa: ANN401
+
+    def set(
+        self,
+        key: str,
+        value: tp.Any,  # noqa: ANN401
+        *,
+        ttl: float | None | NotSet = NotSet.NOT_SET,
+    ) -> None:
+        """Stores the value for `ttl` seconds, `None` - never expires, not set - the backend default."""
+        ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
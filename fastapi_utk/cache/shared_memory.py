@@ -0,0 +1,310 @@
+import fcntl
+import hashlib
+import os
+import pickle  # noqa: S403
+import struct
+import sys
+import tempfile
+import threading
+import time
+import typing as tp
+import zlib
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from ..not_set import NotSet
+
+__all__ = [
+    "SharedMemoryCache",
+]
+
+MAGIC = b"UTKCACHE"
+
+# magic, slots, slot size, ways
+SEGMENT_HEADER = struct.Struct("<8sIII")
+SEGMENT_HEADER_SIZE = 64
+
+# version (seqlock), key digest, expires at (0 - never), value length, value crc32
+SLOT_HEADER = struct.Struct("<Q16sdII")
+SLOT_VERSION = struct.Struct("<Q")
+
+EMPTY_DIGEST = bytes(16)
+
+ATTACH_TIMEOUT = 1.0
+READ_RETRIES = 3
+
+
+class SharedMemoryCache:
+    """
+    Cache backend shared by all worker processes on one host.
+
+    Entries live in a named `multiprocessing.shared_memory` segment split into fixed-size
+    slots, so uvicorn/gunicorn workers share hits without any external service.
+    The first process creates the segment, the others attach to it by name.
+
+    Layout:
+        - keys are hashed (blake2b, 128 bit) into a set of `ways` slots;
+        - each slot holds one pickled value up to `slot_size - 40` bytes, bigger values are not cached;
+        - a full set evicts the entry closest to expiration.
+
+    Concurrency:
+        - reads are lock-free, every slot is guarded by a seqlock (version counter + crc32),
+          a read racing with a write is reported as a miss;
+        - writes lock only their set, with `fcntl` record locks across processes
+          and thread locks inside the process (POSIX only).
+
+    The segment outlives the processes, call `unlink()` on shutdown to remove it.
+
+    Attributes:
+        name: Shared memory segment name, same for all workers.
+        slots: Number of slots (default: 1024).
+        slot_size: Slot size in bytes, header included (default: 4096).
+        ttl: Default entry time to live in seconds, `None` - never expires (default: 60),
+            `set()` may override it per entry.
+        ways: Slots per key hash set (default: 4).
+
+    Example:
+        >>> cache = SharedMemoryCache("my-app-cache")
+        ...
+        >>> if (total := cache.get(f"users:total:{age}")) is None:
+        ...     total = count_users(age=age)
+        ...     cache.set(f"users:total:{age}", total, ttl=30)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        slots: int = 1024,
+        slot_size: int = 4096,
+        ttl: float | None = 60,
+        ways: int = 4,
+    ) -> None:
+        if slot_size <= SLOT_HEADER.size:
+            raise ValueError(f"`slot_size` must be greater than {SLOT_HEADER.size}")
+
+        if ways < 1 or slots < ways or slots % ways:
+            raise ValueError("`slots` must be a positive multiple of `ways`")
+
+        self.name = name
+        self.slots = slots
+        self.slot_size = slot_size
+        self.ttl = ttl
+        self.ways = ways
+
+        self._sets = slots // ways
+        self._max_value_size = slot_size - SLOT_HEADER.size
+        self._shm = self._open_segment()
+        self._buf = self._shm.buf
+        self._thread_locks = [threading.Lock() for _ in range(self._sets)]
+        self._lock_fd = os.open(
+            os.path.join(tempfile.gettempdir(), f"{name}.lock"),
+            os.O_RDWR | os.O_CREAT,
+            0o600,
+        )
+
+    def get(self, key: str) -> tp.Any | None:  # noqa: ANN401
+        digest = self._digest(key)
+        now = time.time()
+
+        for offset in self._set_offsets(digest):
+            for _ in range(READ_RETRIES):
+                version, slot_digest, expires_at, length, crc = SLOT_HEADER.unpack_from(self._buf, offset)
+
+                if version & 1:
+                    continue  # write in progress
+
+                if slot_digest != digest:
+                    break
+
+                if expires_at and expires_at <= now:
+                    return None
+
+                value_offset = offset + SLOT_HEADER.size
+                value = bytes(self._buf[value_offset : value_offset + length])
+
+                if SLOT_VERSION.unpack_from(self._buf, offset)[0] != version or zlib.crc32(value) != crc:
+                    continue  # torn read
+
+                return pickle.loads(value)  # noqa: S301
+
+        return None
+
+    def set(
+        self,
+        key: str,
+        value: tp.Any,  # noqa: ANN401
+        *,
+        ttl: float | None | NotSet = NotSet.NOT_SET,
+    ) -> None:
+        """
+        Stores the value, silently skips values bigger than the slot.
+
+        `ttl` is in seconds, `None` - never expires, not set - the cache default `ttl`.
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if len(data) > self._max_value_size:
+            return
+
+        if ttl is NotSet.NOT_SET:
+            ttl = self.ttl
+
+        digest = self._digest(key)
+        expires_at = time.time() + ttl if ttl is not None else 0.0
+
+        with self._lock_set(digest):
+            offset = self._pick_slot(digest)
+            self._write_slot(offset, digest, expires_at, data)
+
+    def delete(self, key: str) -> None:
+        digest = self._digest(key)
+
+        with self._lock_set(digest):
+            for offset in self._set_offsets(digest):
+                if SLOT_HEADER.unpack_from(self._buf, offset)[1] == digest:
+                    self._write_slot(offset, EMPTY_DIGEST, 0.0, b"")
+
+    def clear(self) -> None:
+        for set_index in range(self._sets):
+            with self._lock_set_index(set_index):
+                for way in range(self.ways):
+                    self._write_slot(self._slot_offset(set_index * self.ways + way), EMPTY_DIGEST, 0.0, b"")
+
+    def close(self) -> None:
+        """Detaches the current process from the segment."""
+        self._shm.close()
+        os.close(self._lock_fd)
+
+    def unlink(self) -> None:
+        """Removes the segment, must be called by one process only (e.g. on shutdown)."""
+        self._shm.unlink()
+
+        try:
+            os.unlink(os.path.join(tempfile.gettempdir(), f"{self.name}.lock"))
+        except FileNotFoundError:
+            ...
+
+    def _open_segment(self) -> SharedMemory:
+        size = SEGMENT_HEADER_SIZE + self.slots * self.slot_size
+
+        try:
+            shm = self._shared_memory(create=True, size=size)
+        except FileExistsError:
+            return self._attach_segment(size)
+
+        SEGMENT_HEADER.pack_into(shm.buf, 0, MAGIC, self.slots, self.slot_size, self.ways)
+
+        return shm
+
+    def _shared_memory(self, *, create: bool, size: int = 0) -> SharedMemory:
+        if sys.version_info >= (3, 13):
+            return SharedMemory(self.name, create=create, size=size, track=False)
+
+        shm = SharedMemory(self.name, create=create, size=size)
+        # otherwise the first exited worker removes the segment for everyone
+        resource_tracker.unregister(shm._name, "shared_memory")
+
+        return shm
+
+    def _attach_segment(self, size: int) -> SharedMemory:
+        deadline = time.monotonic() + ATTACH_TIMEOUT
+
+        # workers start at once: the creator may not have sized the segment or written the header yet
+        while True:
+            try:
+                shm = self._shared_memory(create=False)
+            except ValueError:
+                ...  # "cannot mmap an empty file", not sized yet
+            else:
+                if shm.size >= SEGMENT_HEADER.size and (header := SEGMENT_HEADER.unpack_from(shm.buf, 0))[0] == MAGIC:
+                    if header[1:] != (self.slots, self.slot_size, self.ways) or shm.size < size:
+                        shm.close()
+                        raise ValueError(
+                            f"Shared memory segment '{self.name}' has another layout "
+                            f"(slots={header[1]}, slot_size={header[2]}, ways={header[3]})",
+                        )
+
+                    return shm
+
+                shm.close()
+
+            if time.monotonic() > deadline:
+                raise ValueError(f"Shared memory segment '{self.name}' is not a cache segment")
+
+            time.sleep(0.01)
+
+    @staticmethod
+    def _digest(key: str) -> bytes:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        return digest if digest != EMPTY_DIGEST else b"\x01" + digest[1:]
+
+    def _set_index(self, digest: bytes) -> int:
+        return int.from_bytes(digest[:8], "little") % self._sets
+
+    def _slot_offset(self, slot: int) -> int:
+        return SEGMENT_HEADER_SIZE + slot * self.slot_size
+
+    def _set_offsets(self, digest: bytes) -> list[int]:
+        first_slot = self._set_index(digest) * self.ways
+        return [self._slot_offset(first_slot + way) for way in range(self.ways)]
+
+    def _pick_slot(self, digest: bytes) -> int:
+        now = time.time()
+        offsets = self._set_offsets(digest)
+        headers = [SLOT_HEADER.unpack_from(self._buf, offset) for offset in offsets]
+
+        # the key must never have two copies in the set, otherwise a stale one can reappear
+        for offset, (_, slot_digest, _, _, _) in zip(offsets, headers, strict=True):
+            if slot_digest == digest:
+                return offset
+
+        victim_offset, victim_expires_at = offsets[0], float("inf")
+
+        for offset, (_, slot_digest, expires_at, _, _) in zip(offsets, headers, strict=True):
+            if slot_digest == EMPTY_DIGEST or (expires_at and expires_at <= now):
+                return offset
+
+            if expires_at and expires_at < victim_expires_at:
+                victim_offset, victim_expires_at = offset, expires_at
+
+        return victim_offset
+
+    def _write_slot(self, offset: int, digest: bytes, expires_at: float, data: bytes) -> None:
+        version = SLOT_VERSION.unpack_from(self._buf, offset)[0]
+
+        SLOT_VERSION.pack_into(self._buf, offset, version + 1)
+        value_offset = offset + SLOT_HEADER.size
+        self._buf[value_offset : value_offset + len(data)] = data
+        SLOT_HEADER.pack_into(self._buf, offset, version + 1, digest, expires_at, len(data), zlib.crc32(data))
+        SLOT_VERSION.pack_into(self._buf, offset, version + 2)
+
+    def _lock_set(self, digest: bytes) -> "_SetLock":
+        return self._lock_set_index(self._set_index(digest))
+
+    def _lock_set_index(self, set_index: int) -> "_SetLock":
+        return _SetLock(self._thread_locks[set_index], self._lock_fd, set_index)
+
+
+class _SetLock:
+    """Thread lock + `fcntl` record lock on the set byte of the lock file."""
+
+    def __init__(self, thread_lock: threading.Lock, fd: int, set_index: int) -> None:
+        self.thread_lock = thread_lock
+        self.fd = fd
+        self.set_index = set_index
+
+    def __enter__(self) -> None:
+        self.thread_lock.acquire()
+
+        try:
+            fcntl.lockf(self.fd, fcntl.LOCK_EX, 1, self.set_index)
+        except BaseException:
+            self.thread_lock.release()
+            raise
+
+    def __exit__(self, *_: object) -> None:
+        try:
+            fcntl.lockf(self.fd, fcntl.LOCK_UN, 1, self.set_index)
+        finally:
+            self.thread_lock.release()
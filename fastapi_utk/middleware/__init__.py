@@ -1,5 +1,17 @@
-from .camel_case_query_params import CamelCaseQueryParamsMiddleware
+import typing as tp
+
+from .._lazy import lazy_attributes
+
+if tp.TYPE_CHECKING:
+    from .camel_case_query_params import CamelCaseQueryParamsMiddleware
 
 __all__ = [
     "CamelCaseQueryParamsMiddleware",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {
+        "CamelCaseQueryParamsMiddleware": ".camel_case_query_params",
+    },
+)
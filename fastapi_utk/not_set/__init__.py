@@ -1,5 +1,17 @@
-from .not_set import NotSet
+import typing as tp
+
+from .._lazy import lazy_attributes
+
+if tp.TYPE_CHECKING:
+    from .not_set import NotSet
 
 __all__ = [
     "NotSet",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {
+        "NotSet": ".not_set",
+    },
+)
@@ -1,3 +1,5 @@
+# imported eagerly: the name is shared with its submodule, so a lazy attribute would be
+# shadowed by the module once `fastapi_utk.openapi.translate_query_params_snake_to_camel` is imported
 from .translate_query_params_snake_to_camel import translate_query_params_snake_to_camel
 
 __all__ = [
@@ -1,8 +1,25 @@
-from .paginator import Pagination, Paginator
-from .response import Paginated
+import typing as tp
+
+from .._lazy import lazy_attributes
+
+if tp.TYPE_CHECKING:
+    from .json_response import PaginatedJSONResponse
+    from .paginator import Pagination, Paginator
+    from .response import Paginated
 
 __all__ = [
     "Pagination",
     "Paginated",
+    "PaginatedJSONResponse",
     "Paginator",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {
+        "PaginatedJSONResponse": ".json_response",
+        "Pagination": ".paginator",
+        "Paginator": ".paginator",
+        "Paginated": ".response",
+    },
+)
@@ -1,6 +1,8 @@
 import typing as tp
+from collections.abc import AsyncIterable
 from copy import deepcopy
 from dataclasses import dataclass
+from functools import cache, partial
 
 from fastapi import Query, Request, params
 from pydantic import BaseModel, HttpUrl
@@ -21,7 +23,119 @@ class Paginator:
     url_page_query_param_name: str | None = None
     url_page_size_query_param_name: str | None = None
 
+    @tp.overload
     def __call__[M: BaseModel](
+        self,
+        items: tp.Iterable[M],
+        *,
+        total: int | None = None,
+    ) -> Paginated[M]: ...
+
+    @tp.overload
+    def __call__[M: BaseModel](
+        self,
+        items: tp.Iterable[tp.Any],
+        *,
+        model: type[M],
+        total: int | None = None,
+    ) -> Paginated[M]: ...
+
+    @tp.overload
+    def __call__[R, M: BaseModel](
+        self,
+        items: tp.Iterable[R],
+        *,
+        mapper: tp.Callable[[R], M],
+        total: int | None = None,
+    ) -> Paginated[M]: ...
+
+    @tp.overload
+    def __call__[M: BaseModel](
+        self,
+        items: tp.AsyncIterable[M],
+        *,
+        total: int | None = None,
+    ) -> tp.Awaitable[Paginated[M]]: ...
+
+    @tp.overload
+    def __call__[M: BaseModel](
+        self,
+        items: tp.AsyncIterable[tp.Any],
+        *,
+        model: type[M],
+        total: int | None = None,
+    ) -> tp.Awaitable[Paginated[M]]: ...
+
+    @tp.overload
+    def __call__[R, M: BaseModel](
+        self,
+        items: tp.AsyncIterable[R],
+        *,
+        mapper: tp.Callable[[R], M],
+        total: int | None = None,
+    ) -> tp.Awaitable[Paginated[M]]: ...
+
+    def __call__(
+        self,
+        items: tp.Iterable[tp.Any] | tp.AsyncIterable[tp.Any],
+        *,
+        model: type[BaseModel] | None = None,
+        mapper: tp.Callable[[tp.Any], BaseModel] | None = None,
+        total: int | None = None,
+    ) -> Paginated[tp.Any] | tp.Awaitable[Paginated[tp.Any]]:
+        """
+        Wraps the page items into the `Paginated` response.
+
+        Items may be response models or any rows converted to them one by one while
+        collecting the page, so no intermediate list of rows is built:
+            - `model`: response model built from the row attributes (`from_attributes`);
+            - `mapper`: callable converting a row into the response model.
+
+        If `items` is an async iterable (e.g. an async DB cursor), an awaitable is returned:
+            >>> return await paginator(cursor, model=User, total=total)
+        """
+        item_mapper = self._get_item_mapper(model=model, mapper=mapper)
+
+        if isinstance(items, AsyncIterable):
+            return self._paginate_async(items, item_mapper=item_mapper, total=total)
+
+        if item_mapper is not None:
+            data = [item_mapper(item) for item in items]
+        elif isinstance(items, list):
+            data = items
+        else:
+            data = list(items)
+
+        return self._paginate(data, total=total)
+
+    async def _paginate_async[M: BaseModel](
+        self,
+        items: tp.AsyncIterable[tp.Any],
+        *,
+        item_mapper: tp.Callable[[tp.Any], M] | None,
+        total: int | None,
+    ) -> Paginated[M]:
+        if item_mapper is None:
+            data = [item async for item in items]
+        else:
+            data = [item_mapper(item) async for item in items]
+
+        return self._paginate(data, total=total)
+
+    @staticmethod
+    def _get_item_mapper(
+        model: type[BaseModel] | None,
+        mapper: tp.Callable[[tp.Any], BaseModel] | None,
+    ) -> tp.Callable[[tp.Any], BaseModel] | None:
+        if model is not None and mapper is not None:
+            raise ValueError("Only one of `model` and `mapper` can be set")
+
+        if model is not None:
+            return partial(model.model_validate, from_attributes=True)
+
+        return mapper
+
+    def _paginate[M: BaseModel](
         self,
         items: list[M],
         *,
@@ -112,6 +226,67 @@ class Paginator:
         return (self.page - 1) * self.page_size
 
 
+@cache
+def _build_pagination_dependency(
+    *,
+    default_page: int,
+    default_page_size: int,
+    max_page_size: int | None,
+    url_page_query_param_name: str,
+    url_page_size_query_param_name: str,
+    is_page_size_query_param_enabled: bool,
+) -> tp.Callable[..., Paginator]:
+    """
+    Builds the pagination dependency once per configuration.
+
+    Identical configurations share one callable, so FastAPI can reuse the dependency
+    result across sub-dependencies of a request.
+    """
+    if is_page_size_query_param_enabled:
+
+        def _pagination_dependency(
+            request: Request,
+            page: int = Query(
+                default=default_page,
+                alias=url_page_query_param_name,
+                ge=MIN_PAGE,
+            ),
+            page_size: int = Query(
+                default=default_page_size,
+                alias=url_page_size_query_param_name,
+                ge=MIN_PAGE_SIZE,
+                le=max_page_size,
+            ),
+        ) -> Paginator:
+            return Paginator(
+                page=page,
+                page_size=page_size,
+                url=request.url,
+                url_page_query_param_name=url_page_query_param_name,
+                url_page_size_query_param_name=url_page_size_query_param_name,
+            )
+
+    else:
+
+        def _pagination_dependency(  # type: ignore[misc]
+            request: Request,
+            page: int = Query(
+                default=default_page,
+                alias=url_page_query_param_name,
+                ge=MIN_PAGE,
+                le=max_page_size,
+            ),
+        ) -> Paginator:
+            return Paginator(
+                page=page,
+                page_size=default_page_size,
+                url=request.url,
+                url_page_query_param_name=url_page_query_param_name,
+            )
+
+    return _pagination_dependency
+
+
 @dataclass
 class Pagination:
     default_page: int = 1
@@ -135,49 +310,14 @@ class Pagination:
         url_page_query_param_name = url_page_query_param_name or self.url_page_query_param_name
         url_page_size_query_param_name = url_page_size_query_param_name or self.url_page_size_query_param_name
 
-        if self.url_page_size_query_param_name:
-
-            def _pagination_dependency(
-                request: Request,
-                page: int = Query(
-                    default=default_page,
-                    alias=url_page_query_param_name,
-                    ge=MIN_PAGE,
-                ),
-                page_size: int = Query(
-                    default=default_page_size,
-                    alias=url_page_size_query_param_name,
-                    ge=MIN_PAGE_SIZE,
-                    le=max_page_size,
-                ),
-            ) -> Paginator:
-                return Paginator(
-                    page=page,
-                    page_size=page_size,
-                    url=request.url,
-                    url_page_query_param_name=url_page_query_param_name,
-                    url_page_size_query_param_name=url_page_size_query_param_name,
-                )
-
-        else:
-
-            def _pagination_dependency(  # type: ignore[misc]
-                request: Request,
-                page: int = Query(
-                    default=default_page,
-                    alias=url_page_query_param_name,
-                    ge=MIN_PAGE,
-                    le=max_page_size,
-                ),
-            ) -> Paginator:
-                return Paginator(
-                    page=page,
-                    page_size=default_page_size,
-                    url=request.url,
-                    url_page_query_param_name=url_page_query_param_name,
-                )
-
-        return _pagination_dependency
+        return _build_pagination_dependency(
+            default_page=default_page,
+            default_page_size=default_page_size,
+            max_page_size=max_page_size,
+            url_page_query_param_name=url_page_query_param_name,
+            url_page_size_query_param_name=url_page_size_query_param_name,
+            is_page_size_query_param_enabled=bool(self.url_page_size_query_param_name),
+        )
 
     def Depends(  # noqa
         self,
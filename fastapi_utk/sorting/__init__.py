@@ -1,6 +1,19 @@
-from .sorting import Sorting, SortingOption
+import typing as tp
+
+from .._lazy import lazy_attributes
+
+if tp.TYPE_CHECKING:
+    from .sorting import Sorting, SortingOption
 
 __all__ = [
     "Sorting",
     "SortingOption",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {
+        "Sorting": ".sorting",
+        "SortingOption": ".sorting",
+    },
+)
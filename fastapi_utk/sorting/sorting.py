@@ -1,6 +1,6 @@
-import collections
 import typing as tp
 from dataclasses import dataclass
+from functools import cache
 
 from fastapi import Query, params
 from fastapi.exceptions import RequestValidationError
@@ -16,6 +16,84 @@ class SortingOption(tp.NamedTuple):
         return not self.is_desc
 
 
+@cache
+def _build_sorting_dependency(
+    *,
+    choices: tuple[str, ...],
+    default: tuple[str, ...],
+    delimiter: str,
+    url_query_param_name: str,
+    query_delimiter: str,
+    raise_key_violation: tp.Callable[[str, str, list[str], str], tp.Never] | None,
+    raise_unique_violation: tp.Callable[[str, str, list[str], str], tp.Never] | None,
+) -> tp.Callable[..., list[SortingOption]]:
+    """
+    Builds the sorting dependency once per configuration, with all lookup tables precomputed.
+
+    Identical configurations share one callable, so FastAPI can reuse the dependency
+    result across sub-dependencies of a request.
+    """
+    camel_choices = [to_camel(choice) for choice in choices]
+    all_choices = camel_choices + [f"-{v}" for v in camel_choices]
+    choice_fields = {choice: to_snake(choice) for choice in camel_choices}
+    choices_message = ", ".join(all_choices)
+    default_options = [SortingOption(field=key.lstrip("-"), is_desc=key.startswith("-")) for key in default]
+    example = delimiter.join(default or camel_choices)
+
+    def _sorting_dependency(
+        sorting_query: str | None = Query(
+            default=None,
+            alias=url_query_param_name,
+            example=example,
+        ),
+    ) -> list[SortingOption]:
+        if sorting_query is None:
+            return list(default_options)
+
+        parsed_keys: dict[str, bool] = {}
+
+        for sorting_keys in sorting_query.strip().split(query_delimiter):
+            is_desc = sorting_keys.startswith("-")
+            key = sorting_keys.lstrip("-").strip()
+
+            if not key:
+                continue
+
+            if key not in choice_fields:
+                if raise_key_violation:
+                    raise_key_violation(url_query_param_name, key, all_choices, sorting_query)
+
+                raise RequestValidationError(
+                    [
+                        {
+                            "loc": ["query", url_query_param_name],
+                            "msg": f"Unknown sorting key '{key}', should be one of: {choices_message}",
+                            "type": "value_error.enum",
+                        },
+                    ],
+                )
+
+            if key in parsed_keys:
+                if raise_unique_violation:
+                    raise_unique_violation(url_query_param_name, key, all_choices, sorting_query)
+
+                raise RequestValidationError(
+                    [
+                        {
+                            "loc": ["query", url_query_param_name],
+                            "msg": (f"Sorting keys must be unique — '{key}' is duplicated.",),
+                            "type": "value_error.list.unique_items",
+                        },
+                    ],
+                )
+
+            parsed_keys[key] = is_desc
+
+        return [SortingOption(field=choice_fields[key], is_desc=is_desc) for key, is_desc in parsed_keys.items()]
+
+    return _sorting_dependency
+
+
 @dataclass
 class Sorting:
     """
@@ -76,63 +154,15 @@ class Sorting:
         if url_query_param_name is None:
             url_query_param_name = self.url_query_param_name
 
-        choices = [to_camel(choice) for choice in choices]
-        choices += [f"-{v}" for v in choices]
-
-        def _sorting_dependency(
-            sorting_query: str | None = Query(
-                default=None,
-                alias=tp.cast(str, url_query_param_name),
-                example=tp.cast(str, delimiter).join(
-                    choice for choice in (default or {key for key in choices if not key.startswith("-")})
-                ),
-            ),
-        ) -> list[SortingOption]:
-            if sorting_query is None:
-                return [SortingOption(field=key.lstrip("-"), is_desc=key.startswith("-")) for key in default]
-
-            parsed_keys = collections.OrderedDict()
-
-            for sorting_keys in sorting_query.strip().split(self.delimiter):
-                is_desc = str(sorting_keys).startswith("-")
-                key = str(sorting_keys).lstrip("-").strip()
-
-                if not key:
-                    continue
-
-                if key not in choices:
-                    if self.raise_key_violation:
-                        self.raise_key_violation(url_query_param_name, key, choices, sorting_query)
-
-                    raise RequestValidationError(
-                        [
-                            {
-                                "loc": ["query", url_query_param_name],
-                                "msg": f"Unknown sorting key '{key}', should be one of: {', '.join(choices)}",
-                                "type": "value_error.enum",
-                            },
-                        ],
-                    )
-
-                if key in parsed_keys:
-                    if self.raise_unique_violation:
-                        self.raise_unique_violation(url_query_param_name, key, choices, sorting_query)
-
-                    raise RequestValidationError(
-                        [
-                            {
-                                "loc": ["query", url_query_param_name],
-                                "msg": (f"Sorting keys must be unique — '{key}' is duplicated.",),
-                                "type": "value_error.list.unique_items",
-                            },
-                        ],
-                    )
-
-                parsed_keys[key] = is_desc
-
-            return [(SortingOption(field=to_snake(key), is_desc=is_desc)) for key, is_desc in parsed_keys.items()]
-
-        return _sorting_dependency
+        return _build_sorting_dependency(
+            choices=tuple(choices),
+            default=tuple(default),
+            delimiter=delimiter,
+            url_query_param_name=url_query_param_name,
+            query_delimiter=self.delimiter,
+            raise_key_violation=self.raise_key_violation,
+            raise_unique_violation=self.raise_unique_violation,
+        )
 
     def Depends(  # noqa
         self,
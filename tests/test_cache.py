@@ -0,0 +1,154 @@
+import _posixshmem
+import mmap
+import multiprocessing
+import os
+import threading
+import time
+import typing as tp
+import uuid
+from multiprocessing.synchronize import Barrier
+
+import pytest
+
+from fastapi_utk.cache import CacheBackend, SharedMemoryCache
+from fastapi_utk.cache.shared_memory import MAGIC, SEGMENT_HEADER, SEGMENT_HEADER_SIZE
+
+
+@pytest.fixture
+def cache() -> tp.Iterator[SharedMemoryCache]:
+    # a single set of 4 ways, so every key competes for the same slots
+    shared_cache = SharedMemoryCache(f"utk-test-{uuid.uuid4().hex}", slots=4, slot_size=256, ways=4)
+
+    yield shared_cache
+
+    shared_cache.close()
+    shared_cache.unlink()
+
+
+def test_is_cache_backend(cache: SharedMemoryCache) -> None:
+    assert isinstance(cache, CacheBackend)
+
+
+def test_set_get_delete(cache: SharedMemoryCache) -> None:
+    cache.set("total", 42)
+    assert cache.get("total") == 42
+
+    cache.delete("total")
+    assert cache.get("total") is None
+
+
+def test_ttl(cache: SharedMemoryCache) -> None:
+    cache.set("key", "value", ttl=0.05)
+    time.sleep(0.1)
+
+    assert cache.get("key") is None
+
+
+def test_ttl_none_never_expires() -> None:
+    cache = SharedMemoryCache(f"utk-test-{uuid.uuid4().hex}", slots=4, slot_size=256, ttl=0.05, ways=4)
+
+    cache.set("default", "value")
+    cache.set("forever", "value", ttl=None)
+    time.sleep(0.1)
+
+    assert cache.get("default") is None
+    assert cache.get("forever") == "value"
+
+    cache.close()
+    cache.unlink()
+
+
+def test_too_big_value_is_not_cached(cache: SharedMemoryCache) -> None:
+    cache.set("key", b"x" * 1000)
+
+    assert cache.get("key") is None
+
+
+def test_overwrite_after_delete_does_not_resurrect_stale_value(cache: SharedMemoryCache) -> None:
+    cache.set("a", "a")
+    cache.set("key", "old-forever", ttl=None)
+    cache.delete("a")
+
+    cache.set("key", "new", ttl=0.05)
+    time.sleep(0.1)
+    cache.set("b", "b")
+
+    assert cache.get("key") is None
+
+
+def test_segment_is_shared(cache: SharedMemoryCache) -> None:
+    other = SharedMemoryCache(cache.name, slots=4, slot_size=256, ways=4)
+    cache.set("key", {"total": 1})
+
+    assert other.get("key") == {"total": 1}
+
+    other.close()
+
+
+def test_segment_layout_mismatch(cache: SharedMemoryCache) -> None:
+    with pytest.raises(ValueError, match="another layout"):
+        SharedMemoryCache(cache.name, slots=8, slot_size=256, ways=4)
+
+
+def test_attach_waits_for_creator() -> None:
+    name = f"utk-test-{uuid.uuid4().hex}"
+    size = SEGMENT_HEADER_SIZE + 4 * 256
+    attached: list[SharedMemoryCache] = []
+
+    # the creator's window: the segment exists but is neither sized nor initialized yet
+    fd = _posixshmem.shm_open(f"/{name}", os.O_CREAT | os.O_EXCL | os.O_RDWR, mode=0o600)
+    attacher = threading.Thread(
+        target=lambda: attached.append(SharedMemoryCache(name, slots=4, slot_size=256, ways=4)),
+    )
+    attacher.start()
+    time.sleep(0.05)
+
+    os.ftruncate(fd, size)
+    time.sleep(0.05)
+
+    with mmap.mmap(fd, size) as buf:
+        SEGMENT_HEADER.pack_into(buf, 0, MAGIC, 4, 256, 4)
+
+    os.close(fd)
+    attacher.join()
+
+    assert len(attached) == 1
+
+    attached[0].set("key", "value")
+    assert attached[0].get("key") == "value"
+
+    attached[0].close()
+    attached[0].unlink()
+
+
+def _attach(name: str, barrier: Barrier, errors: "multiprocessing.Queue[str]") -> None:
+    barrier.wait()
+
+    try:
+        cache = SharedMemoryCache(name, slots=4, slot_size=256, ways=4)
+        cache.set(str(multiprocessing.current_process().pid), 1)
+        cache.close()
+    except Exception as e:  # noqa: BLE001
+        errors.put(repr(e))
+
+
+@pytest.mark.parametrize("trial", range(10))
+def test_concurrent_attach(trial: int) -> None:  # noqa: ARG001
+    context = multiprocessing.get_context("fork")
+    name = f"utk-test-{uuid.uuid4().hex}"
+    barrier = context.Barrier(8)
+    errors: multiprocessing.Queue[str] = context.Queue()
+    processes = [context.Process(target=_attach, args=(name, barrier, errors)) for _ in range(8)]
+
+    for process in processes:
+        process.start()
+
+    for process in processes:
+        process.join()
+
+    cache = SharedMemoryCache(name, slots=4, slot_size=256, ways=4)
+    cache.close()
+    cache.unlink()
+
+    assert [process.exitcode for process in processes] == [0] * 8
+    assert errors.empty(), errors.get()
@@ -0,0 +1,116 @@
+import typing as tp
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+
+from fastapi_utk import Pagination, Sorting, SortingOption
+
+CHOICES = ["created_at", "name"]
+
+
+def test_identical_sorting_configs_share_dependency() -> None:
+    assert Sorting()(CHOICES, default=["name"]) is Sorting()(list(CHOICES), default=["name"])
+
+
+@pytest.mark.parametrize(
+    ("sorting", "kwargs"),
+    [
+        (Sorting(), {"choices": ["created_at"]}),
+        (Sorting(), {"choices": CHOICES, "default": ["name"]}),
+        (Sorting(), {"choices": CHOICES, "url_query_param_name": "order"}),
+        (Sorting(delimiter=";"), {"choices": CHOICES}),
+    ],
+)
+def test_different_sorting_configs_do_not_share_dependency(sorting: Sorting, kwargs: dict[str, tp.Any]) -> None:
+    assert sorting(**kwargs) is not Sorting()(CHOICES)
+
+
+def test_identical_pagination_configs_share_dependency() -> None:
+    assert Pagination()() is Pagination()()
+    assert Pagination(max_page_size=50)() is Pagination()(max_page_size=50)
+
+
+@pytest.mark.parametrize(
+    "pagination",
+    [
+        Pagination(default_page_size=20),
+        Pagination(max_page_size=50),
+        Pagination(url_page_query_param_name="p"),
+        Pagination(url_page_size_query_param_name=""),
+    ],
+)
+def test_different_pagination_configs_do_not_share_dependency(pagination: Pagination) -> None:
+    assert pagination() is not Pagination()()
+
+
+def test_sorting_camel_case_keys() -> None:
+    sorting_dependency = Sorting()(CHOICES)
+
+    assert sorting_dependency("-createdAt,name") == [
+        SortingOption(field="created_at", is_desc=True),
+        SortingOption(field="name", is_desc=False),
+    ]
+
+
+def test_sorting_default_options() -> None:
+    sorting_dependency = Sorting()(CHOICES, default=["-created_at", "name"])
+    options = sorting_dependency(None)
+
+    assert options == [
+        SortingOption(field="created_at", is_desc=True),
+        SortingOption(field="name", is_desc=False),
+    ]
+
+    # the defaults are shared between requests, a caller must not be able to change them
+    options.clear()
+    assert sorting_dependency(None) == [
+        SortingOption(field="created_at", is_desc=True),
+        SortingOption(field="name", is_desc=False),
+    ]
+
+
+def test_sorting_unknown_key() -> None:
+    with pytest.raises(RequestValidationError) as exc_info:
+        Sorting()(CHOICES)("name,age")
+
+    assert exc_info.value.errors() == [
+        {
+            "loc": ["query", "sort"],
+            "msg": "Unknown sorting key 'age', should be one of: createdAt, name, -createdAt, -name",
+            "type": "value_error.enum",
+        },
+    ]
+
+
+def test_sorting_duplicated_key() -> None:
+    with pytest.raises(RequestValidationError) as exc_info:
+        Sorting()(CHOICES)("name,-name")
+
+    assert exc_info.value.errors() == [
+        {
+            "loc": ["query", "sort"],
+            "msg": ("Sorting keys must be unique — 'name' is duplicated.",),
+            "type": "value_error.list.unique_items",
+        },
+    ]
+
+
+def test_sorting_custom_violation_handlers() -> None:
+    calls: list[tuple[str, str, list[str], str]] = []
+
+    def raise_violation(name: str, key: str, choices: list[str], query: str) -> tp.Never:
+        calls.append((name, key, choices, query))
+        raise ValueError(key)
+
+    sorting = Sorting(raise_key_violation=raise_violation, raise_unique_violation=raise_violation)
+
+    with pytest.raises(ValueError, match="age"):
+        sorting(CHOICES)("age")
+
+    with pytest.raises(ValueError, match="name"):
+        sorting(CHOICES)("name,name")
+
+    assert calls == [
+        ("sort", "age", ["createdAt", "name", "-createdAt", "-name"], "age"),
+        ("sort", "name", ["createdAt", "name", "-createdAt", "-name"], "name,name"),
+    ]
@@ -0,0 +1,45 @@
+import subprocess  # noqa: S404
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+IMPORT_TIME_BUDGET_US = 50_000
+RUNS = 3  # the best run is checked, the first one may hit a cold filesystem cache
+
+HEAVY_MODULES = ["fastapi", "starlette", "pydantic"]
+
+
+def import_fastapi_utk() -> tuple[int, list[str]]:
+    """Imports `fastapi_utk` in a fresh interpreter, returns cumulative import time (us) and loaded heavy modules."""
+    code = f"import sys, fastapi_utk; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+
+    # import time: self [us] | cumulative | imported package
+    for line in result.stderr.splitlines():
+        _, _, timings = line.partition("import time:")
+        _, cumulative, package = (part.strip() for part in timings.split("|"))
+
+        if package == "fastapi_utk":
+            return int(cumulative), [module for module in result.stdout.strip().split(",") if module]
+
+    raise AssertionError(f"`fastapi_utk` is not found in the importtime output:\n{result.stderr}")
+
+
+def test_import_time_budget() -> None:
+    import_time = min(import_fastapi_utk()[0] for _ in range(RUNS))
+
+    assert import_time < IMPORT_TIME_BUDGET_US, f"import fastapi_utk took {import_time} us"
+
+
+def test_heavy_dependencies_are_not_imported() -> None:
+    _, heavy_modules = import_fastapi_utk()
+
+    assert heavy_modules == []
@@ -0,0 +1,139 @@
+import asyncio
+import json
+import typing as tp
+
+import pytest
+from fastapi import FastAPI
+from pydantic import BaseModel
+from pydantic.alias_generators import to_camel
+from starlette.types import Message, Scope
+
+from fastapi_utk import Paginated, PaginatedJSONResponse, Pagination, Paginator
+
+
+class User(BaseModel):
+    id: int
+    full_name: str
+    score: float | None
+    is_active: bool
+
+    class Config:
+        from_attributes = True
+        populate_by_name = True
+        alias_generator = to_camel
+
+
+USERS = [
+    User(id=1, full_name='Ünïcødé "Elliot" 🚀', score=3e-07, is_active=True),
+    User(id=2, full_name="Mr. Robot", score=1e16, is_active=False),
+    User(id=3, full_name="Angela\nMoss", score=None, is_active=True),
+    User(id=4, full_name="Darlene", score=0.1 + 0.2, is_active=False),
+    User(id=5, full_name="Tyrell", score=-0.0, is_active=True),
+]
+
+pagination = Pagination()
+app = FastAPI()
+
+
+@app.get("/envelope/{with_total}")
+def model_endpoint(
+    paginator: tp.Annotated[Paginator, pagination.Depends()],
+    with_total: bool,
+) -> Paginated[User]:
+    return paginator(
+        USERS[paginator.offset : paginator.offset + paginator.limit], total=len(USERS) if with_total else None
+    )
+
+
+@app.get("/response/{with_total}", response_model=Paginated[User])
+def response_endpoint(
+    paginator: tp.Annotated[Paginator, pagination.Depends()],
+    with_total: bool,
+) -> PaginatedJSONResponse:
+    return PaginatedJSONResponse(
+        paginator(
+            USERS[paginator.offset : paginator.offset + paginator.limit], total=len(USERS) if with_total else None
+        ),
+    )
+
+
+def get(path: str, query_string: str) -> tuple[int, dict[bytes, bytes], bytes]:
+    """Calls the app directly over ASGI, returns status, headers and body."""
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    scope: Scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string.encode(),
+        "headers": [(b"host", b"testserver")],
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 0),
+    }
+
+    asyncio.run(app(scope, receive, send))
+
+    start, *body = messages
+
+    return start["status"], dict(start["headers"]), b"".join(message.get("body", b"") for message in body)
+
+
+@pytest.mark.parametrize("with_total", [True, False])
+@pytest.mark.parametrize("query_string", ["", "page=2&pageSize=2", "page=3&pageSize=2", "page=9&pageSize=1&q=%C3%A9"])
+def test_body_is_identical_to_paginated(query_string: str, with_total: bool) -> None:
+    expected = get(f"/envelope/{with_total}", query_string)
+    status, headers, body = get(f"/response/{with_total}", query_string)
+
+    assert status == expected[0] == 200
+    assert headers == expected[1]
+    assert body == expected[2].replace(b"/envelope/", b"/response/")
+
+
+def test_golden_body() -> None:
+    _, _, body = get("/response/True", "page=1&pageSize=3")
+
+    assert (
+        body
+        == (
+            '{"data":['
+            '{"id":1,"fullName":"Ünïcødé \\"Elliot\\" 🚀","score":3e-07,"isActive":true},'
+            '{"id":2,"fullName":"Mr. Robot","score":1e+16,"isActive":false},'
+            '{"id":3,"fullName":"Angela\\nMoss","score":null,"isActive":true}'
+            '],"pagination":{"page":1,"pageSize":3,"totalPages":2,"total":5,'
+            '"nextPage":"http://testserver/response/True?page=2&pageSize=3","prevPage":null}}'
+        ).encode()
+    )
+
+
+class Admin(User):
+    role: str
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [],
+        [Admin(id=6, full_name="Whiterose", score=None, is_active=True, role="root")],
+        [USERS[0], Admin(id=6, full_name="Whiterose", score=None, is_active=True, role="root")],
+    ],
+)
+def test_items_are_written_as_they_are(items: list[User]) -> None:
+    page = Paginator(page=1, page_size=5)(items)
+    body = PaginatedJSONResponse(page).body
+
+    assert json.loads(body) == json.loads(page.model_dump_json(by_alias=True))
+
+
+def test_other_content_is_rendered_as_json() -> None:
+    assert PaginatedJSONResponse({"a": [1, 2.5]}).body == b'{"a":[1,2.5]}'
@@ -0,0 +1,55 @@
+import importlib
+import subprocess  # noqa: S404
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+PUBLIC_API = {
+    "fastapi_utk": [
+        "NotSet",
+        "Paginated",
+        "PaginatedJSONResponse",
+        "Pagination",
+        "Paginator",
+        "Sorting",
+        "SortingOption",
+    ],
+    "fastapi_utk.cache": ["CacheBackend", "SharedMemoryCache"],
+    "fastapi_utk.middleware": ["CamelCaseQueryParamsMiddleware"],
+    "fastapi_utk.not_set": ["NotSet"],
+    "fastapi_utk.openapi": ["translate_query_params_snake_to_camel"],
+    "fastapi_utk.pagination": ["Paginated", "PaginatedJSONResponse", "Pagination", "Paginator"],
+    "fastapi_utk.sorting": ["Sorting", "SortingOption"],
+}
+
+
+@pytest.mark.parametrize(("package_name", "names"), PUBLIC_API.items())
+def test_public_api(package_name: str, names: list[str]) -> None:
+    package = importlib.import_module(package_name)
+
+    assert sorted(package.__all__) == sorted(names)
+
+    for name in names:
+        assert not isinstance(getattr(package, name), type(sys))
+        assert name in dir(package)
+
+
+def test_name_shared_with_submodule_is_not_shadowed() -> None:
+    # a fresh interpreter, the submodule has to be imported before the package attribute is accessed
+    code = (
+        "import fastapi_utk.openapi.translate_query_params_snake_to_camel\n"
+        "from fastapi_utk.openapi import translate_query_params_snake_to_camel\n"
+        "assert callable(translate_query_params_snake_to_camel), translate_query_params_snake_to_camel\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=ROOT)  # noqa: S603
+
+
+def test_unknown_attribute() -> None:
+    import fastapi_utk
+
+    with pytest.raises(AttributeError):
+        _ = fastapi_utk.Unknown
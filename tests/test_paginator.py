@@ -0,0 +1,93 @@
+import asyncio
+import typing as tp
+from dataclasses import dataclass
+
+import pytest
+from pydantic import BaseModel
+from pydantic.alias_generators import to_camel
+
+from fastapi_utk import Paginated, Paginator
+
+
+class User(BaseModel):
+    id: int
+    name: str
+
+    class Config:
+        populate_by_name = True
+        alias_generator = to_camel
+
+
+@dataclass
+class UserRow:
+    id: int
+    name: str
+
+
+ROWS = [UserRow(id=1, name="Elliot"), UserRow(id=2, name="Darlene"), UserRow(id=3, name="Angela")]
+USERS = [User(id=row.id, name=row.name) for row in ROWS]
+
+
+@pytest.fixture
+def paginator() -> Paginator:
+    return Paginator(page=1, page_size=5)
+
+
+def test_models(paginator: Paginator) -> None:
+    page = paginator(USERS, total=3)
+
+    assert page.data == USERS
+    assert page.pagination.page_size == 3
+    assert page.pagination.total_pages == 1
+
+
+def test_generator_with_model(paginator: Paginator) -> None:
+    rows = (row for row in ROWS)
+
+    page = paginator(rows, model=User, total=3)
+
+    assert isinstance(page, Paginated)
+    assert page.data == USERS
+    assert page.pagination.page_size == 3
+    assert page.pagination.total == 3
+
+
+def test_mapper(paginator: Paginator) -> None:
+    page = paginator(ROWS, mapper=lambda row: User(id=row.id, name=row.name.upper()))
+
+    assert [user.name for user in page.data] == ["ELLIOT", "DARLENE", "ANGELA"]
+    assert page.pagination.total is None
+
+
+def test_async_iterable_is_awaited(paginator: Paginator) -> None:
+    async def cursor() -> tp.AsyncIterator[UserRow]:
+        for row in ROWS:
+            yield row
+
+    async def paginate() -> Paginated[User]:
+        result = paginator(cursor(), model=User, total=3)
+
+        assert not isinstance(result, Paginated)
+
+        return await result
+
+    page = asyncio.run(paginate())
+
+    assert page.data == USERS
+    assert page.pagination.page_size == 3
+
+
+def test_async_iterable_of_models(paginator: Paginator) -> None:
+    async def cursor() -> tp.AsyncIterator[User]:
+        for user in USERS:
+            yield user
+
+    async def paginate() -> Paginated[User]:
+        return await paginator(cursor(), total=3)
+
+    assert asyncio.run(paginate()).data == USERS
+
+
+def test_model_and_mapper_are_exclusive(paginator: Paginator) -> None:
+    with pytest.raises(ValueError, match="Only one of `model` and `mapper`"):
+        paginator(ROWS, model=User, mapper=lambda row: User(id=row.id, name=row.name))  # type: ignore[call-overload]